@@ -13,9 +13,10 @@ class Calculator:
 
     def divide(self, x: float, y: float) -> float:
         """Divide x by y"""
-        if y == 0:
-            raise ValueError("Cannot divide by zero")
-        return x / y
+        try:
+            return x / y
+        except ZeroDivisionError:
+            raise ValueError("Cannot divide by zero") from None
 
     def power(self, x: float, y: float) -> float:
         """Calculate x raised to the power of y"""